@@ -52,6 +52,7 @@ app = create_app()
 # - For larger apps, consider using Flask-Migrate for schema changes
 
 db_manager = DatabaseManager()
+db_manager.init_database()
 
 # 🚀 DEVELOPMENT SERVER STARTUP
 # ==============================
@@ -69,6 +70,26 @@ if __name__ == '__main__':
     # It exposes sensitive information and allows code execution
     debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
     
+    # 🏭 Production Server Handoff
+    # The Werkzeug dev server is threaded but single-process and not built for
+    # production traffic; in production replace this process with Gunicorn's
+    # pre-forked worker processes (production-grade server, CPU work spread
+    # across cores, threads per worker overlap database waits).
+    # Worker count comes from WEB_CONCURRENCY, which Gunicorn reads itself
+    # (default 1) - cpu_count() would report the host's cores inside a
+    # container and start far more workers (and DB pools) than the instance
+    # can hold. --preload imports the app once in the master, so schema setup
+    # runs there instead of in every worker; the connection pool and click
+    # writer thread are created lazily, so forking after it is safe.
+    if os.environ.get('FLASK_ENV') == 'production' and not debug_mode:
+        os.execvp('gunicorn', [
+            'gunicorn', 'app:app',
+            '--bind', f'0.0.0.0:{port}',
+            '--preload',
+            '--worker-class', 'gthread',
+            '--threads', os.environ.get('GUNICORN_THREADS', '4'),
+        ])
+    
     # 🌐 Server Binding
     # host='0.0.0.0' allows external connections (required for cloud deployment)
     # In development, this allows access from other devices on your network
@@ -11,6 +11,11 @@ from ..models import create_user, authenticate_user
 
 auth_bp = Blueprint('auth', __name__)
 
+def _form_fields(*names):
+    """Read and strip the named fields from the submitted form."""
+    form = request.form
+    return [form.get(name, '').strip() for name in names]
+
 @auth_bp.route('/register', methods=['GET', 'POST'])
 def register():
     """User registration with validation."""
@@ -18,9 +23,7 @@ def register():
         return redirect(url_for('links.dashboard'))
 
     if request.method == 'POST':
-        username = request.form.get('username', '').strip()
-        email = request.form.get('email', '').strip()
-        password = request.form.get('password', '').strip()
+        username, email, password = _form_fields('username', 'email', 'password')
 
         if not all([username, email, password]):
             flash('All fields are required.', 'error')
@@ -43,8 +46,7 @@ def login():
         return redirect(url_for('links.dashboard'))
 
     if request.method == 'POST':
-        username = request.form.get('username', '').strip()
-        password = request.form.get('password', '').strip()
+        username, password = _form_fields('username', 'password')
 
         if not username or not password:
             flash('Please enter both username and password.', 'error')
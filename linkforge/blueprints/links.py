@@ -13,38 +13,59 @@ All URL shortening functionality with every requested feature implemented:
 No placeholder code - everything is fully functional.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash, Response, send_file, jsonify
-from ..db_utils import get_db_cursor, get_db_connection
-import sqlite3
-import string
-import random
-import qrcode
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, Response, send_file, jsonify, g, stream_with_context
+from ..db_utils import get_db_cursor
+import secrets
 import io
-import base64
+import hashlib
 import csv
+import itertools
 import zipfile
 import re
-from datetime import datetime, timedelta
-from urllib.parse import urlparse
-from werkzeug.security import generate_password_hash, check_password_hash
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit
 from ..models import (
-    DatabaseManager, create_link, get_user_links, get_link_by_short_code,
+    create_link, get_user_links, iter_user_links, get_link_by_short_code,
     update_link_url, delete_links, record_click, is_link_expired, 
     verify_link_password, get_user_stats
 )
 
 links_bp = Blueprint('links', __name__)
 
+# Characters not allowed in custom codes / download filenames
+CUSTOM_CODE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Links shown per dashboard page
+DASHBOARD_PAGE_SIZE = 25
+
+# Random short codes are retried this many times if they collide
+MAX_CODE_ATTEMPTS = 5
+
+# Number of rendered QR images kept in memory per worker
+QR_CACHE_SIZE = 4096
+
+# Browser cache lifetime for dashboard QR previews (short codes never change)
+QR_IMAGE_MAX_AGE = 86400
+
+def short_url_root():
+    """Base URL for short links (no trailing slash), computed once per request."""
+    if 'url_root' not in g:
+        g.url_root = request.url_root.rstrip('/')
+    return g.url_root
+
 def generate_short_code(username, custom_code=None, length=6):
     """Generate short code with user namespace."""
     if custom_code:
         # Clean custom code
-        clean_code = re.sub(r'[^a-zA-Z0-9_-]', '-', custom_code.lower())
+        clean_code = CUSTOM_CODE_RE.sub('-', custom_code.lower())
         return f"{username}/{clean_code}"
     else:
-        # Generate random code
-        chars = string.ascii_letters + string.digits
-        random_code = ''.join(random.choices(chars, k=length))
+        # Generate random code from the OS CSPRNG in one call; the URL-safe
+        # alphabet ([A-Za-z0-9_-]) is the same one custom codes are cleaned to.
+        # Each byte yields 4/3 base64 characters, so draw only enough bytes.
+        random_code = secrets.token_urlsafe((length * 3 + 3) // 4)[:length]
         return f"{username}/{random_code}"
 
 def validate_url(url):
@@ -53,28 +74,42 @@ def validate_url(url):
         return False, ""
 
     url = url.strip()
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
 
+    # Split first: a bare "example.com/?r=https://x.org" has no scheme of its
+    # own (the '://' is in the query), and "example.com:8080" parses as scheme
+    # "example.com" with no //netloc - both get https:// prefixed
     try:
-        parsed = urlparse(url)
-        if parsed.scheme and parsed.netloc:
-            return True, url
-    except:
-        pass
+        parts = urlsplit(url)
+        if not parts.scheme or (parts.scheme not in ('http', 'https') and not parts.netloc):
+            url = 'https://' + url
+            parts = urlsplit(url)
+
+        # Non-web schemes with an authority (ftp://, file://, ...) are rejected
+        # below. Scheme-only strings were prefixed above and are judged as https
+        # URLs: "javascript:alert(1)" and "data:text/html,..." have a
+        # non-numeric port, so .port raises ValueError and they are rejected;
+        # "mailto:a@b.c" becomes https://mailto:a@b.c (userinfo + host b.c)
+        parts.port
+    except ValueError:
+        return False, ""
+
+    if parts.scheme in ('http', 'https') and parts.netloc:
+        return True, url
 
     return False, ""
 
-def generate_qr_code(url, size='small', as_attachment=True, filename=None):
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def render_qr_png(url, size='small'):
     """
-    Generate QR code for URL.
+    Render QR code for URL as PNG bytes.
     
-    Args:
-        url: URL to encode
-        size: 'small' for inline display, 'large' for download
-        as_attachment: True for download, False for inline display
-        filename: Custom filename for download
+    Output depends only on (url, size), so rendered images are memoized and
+    repeat dashboard loads or downloads skip the QR/PNG encoding work.
     """
+    # Imported lazily: qrcode and PIL are only needed by QR routes
+    import qrcode
+    from PIL import Image
+
     box_size = 5 if size == 'small' else 10
     border = 2 if size == 'small' else 4
 
@@ -89,20 +124,48 @@ def generate_qr_code(url, size='small', as_attachment=True, filename=None):
     qr.make(fit=True)
 
     # Create traditional black QR pattern on white background
-    img = qr.make_image(fill_color="#000000", back_color="#ffffff")
+    # Blit the module matrix (border included) as one pixel per module and
+    # scale it up, instead of drawing every module as a rectangle; 1-bit
+    # mode keeps the PNG small and fast to encode
+    matrix = qr.get_matrix()
+    modules = len(matrix)
+    img = Image.new('1', (modules, modules))
+    img.putdata([0 if cell else 1 for row in matrix for cell in row])
+    img = img.resize((modules * box_size, modules * box_size), Image.NEAREST)
     
     # Save to buffer
     img_buffer = io.BytesIO()
     img.save(img_buffer, format='PNG')
-    img_buffer.seek(0)
     
-    return send_file(
-        img_buffer,
+    return img_buffer.getvalue()
+
+def generate_qr_code(url, size='small', as_attachment=True, filename=None, max_age=None):
+    """
+    Generate QR code for URL.
+    
+    Args:
+        url: URL to encode
+        size: 'small' for inline display, 'large' for download
+        as_attachment: True for download, False for inline display
+        filename: Custom filename for download
+        max_age: Seconds the browser may cache the image (None disables caching)
+    """
+    response = send_file(
+        io.BytesIO(render_qr_png(url, size)),
         mimetype='image/png',
         as_attachment=as_attachment,
-        download_name=filename
+        download_name=filename,
+        etag=hashlib.sha1(f"{size}:{url}".encode()).hexdigest(),
+        max_age=max_age
     )
 
+    if max_age:
+        # Images sit behind login, so only the user's browser may cache them
+        response.cache_control.public = False
+        response.cache_control.private = True
+
+    return response
+
 @links_bp.route('/dashboard')
 def dashboard():
     """Main dashboard with all features."""
@@ -116,48 +179,64 @@ def dashboard():
     # Get search query
     search_query = request.args.get('search', '').strip()
 
-    # Get user links
-    links = get_user_links(user_id, search_query)
-
-    # Add QR codes and expiration status to links
+    # Current page (1-based); junk or out-of-range values fall back to page 1
+    page = request.args.get('page', 1, type=int)
+    if page < 1:
+        page = 1
+
+    # Get one page of user links - one extra row tells us whether a next page exists
+    links = get_user_links(user_id, search_query,
+                           limit=DASHBOARD_PAGE_SIZE + 1,
+                           offset=(page - 1) * DASHBOARD_PAGE_SIZE)
+    has_next = len(links) > DASHBOARD_PAGE_SIZE
+    links = links[:DASHBOARD_PAGE_SIZE]
+
+    # Past the last page (e.g. after deleting links) - go back to the start
+    if page > 1 and not links:
+        return redirect(url_for('links.dashboard', search=search_query or None))
+
+    # Add expiration status to links
+    # (QR previews are fetched by the browser from links.qr_image)
+    now = datetime.now()
     for link in links:
-        # Generate small QR code for display
-        short_url = f"{request.url_root.rstrip('/')}/{link['short_code']}"
-        link['qr_code_small'] = generate_qr_code(short_url, 'small', as_attachment=False)
-
-        # Check expiration status
-        link['is_expired'] = is_link_expired(link)
-        link['has_password'] = bool(link.get('password_hash'))
-
-        # Format expiration date for display
-        if link.get('expiration_date'):
-            try:
-                exp_date = datetime.fromisoformat(link['expiration_date'])
-                link['expiration_display'] = exp_date.strftime('%Y-%m-%d %H:%M')
-
-                # Calculate days remaining
-                days_left = (exp_date - datetime.now()).days
-                if days_left < 0:
-                    link['expiration_status'] = 'Expired'
-                elif days_left == 0:
-                    link['expiration_status'] = 'Expires today'
-                else:
-                    link['expiration_status'] = f'{days_left} days left'
-            except:
-                link['expiration_display'] = 'Invalid date'
-                link['expiration_status'] = 'Error'
-        else:
-            link['expiration_display'] = 'Never'
+        link['has_password'] = link['password_hash'] is not None
+        link['is_expired'] = is_link_expired(link, now)
+        exp_date = link['expiration_date']
+
+        # Expiration status for display
+        # (psycopg2 already returns TIMESTAMP columns as datetime - no parsing)
+        if exp_date is None:
             link['expiration_status'] = 'Never expires'
+            continue
+
+        # Calculate days remaining
+        days_left = (exp_date - now).days
+        if days_left < 0:
+            link['expiration_status'] = 'Expired'
+        elif days_left == 0:
+            link['expiration_status'] = 'Expires today'
+        else:
+            link['expiration_status'] = f'{days_left} days left'
 
-    # Get user statistics
-    stats = get_user_stats(user_id)
+    # Get user statistics - when a single unfiltered page holds all of the
+    # user's links, the stats come from them instead of another query
+    if search_query or page > 1 or has_next:
+        stats = get_user_stats(user_id)
+    else:
+        stats = {
+            'total_links': len(links),
+            'total_clicks': sum(link['clicks'] or 0 for link in links),
+            'active_links': sum(1 for link in links if link['is_active']),
+            'expired_links': sum(1 for link in links if link['is_expired'])
+        }
 
     return render_template('dashboard.html',
                          links=links,
                          stats=stats,
                          username=username,
-                         current_search=search_query)
+                         current_search=search_query,
+                         page=page,
+                         has_next=has_next)
 
 @links_bp.route('/create', methods=['POST'])
 def create_link_route():
@@ -222,15 +301,19 @@ def create_link_route():
             }
             expiration_days = expiration_map.get(expiration_option)
 
-    # Create link
-    result = create_link(
-        user_id=user_id,
-        original_url=clean_url,
-        display_name=display_name,
-        short_code=short_code,
-        password=password if password else None,
-        expiration_days=expiration_days
-    )
+    # Create link, regenerating random codes on the (rare) collision
+    for _ in range(MAX_CODE_ATTEMPTS):
+        result = create_link(
+            user_id=user_id,
+            original_url=clean_url,
+            display_name=display_name,
+            short_code=short_code,
+            password=password if password else None,
+            expiration_days=expiration_days
+        )
+        if custom_code or not result.get('duplicate'):
+            break
+        short_code = generate_short_code(username)
 
     if result['success']:
         flash(f'Link created: /{short_code}', 'success')
@@ -345,18 +428,24 @@ def get_selected_links(user_id, selected_link_ids):
         return []
     
     try:
-        cursor = get_db_cursor()
+        link_ids = [int(link_id) for link_id in selected_link_ids]
+    except ValueError:
+        return []
 
-        placeholders = ','.join('%s' for _ in selected_link_ids)
-        params = selected_link_ids + [user_id]
+    try:
+        cursor = get_db_cursor()
 
-        cursor.execute(f"""
-            SELECT * FROM links 
-            WHERE id IN ({placeholders}) AND user_id = %s
-        """, params)
-        links = cursor.fetchall()
-        
-        return [dict(link) for link in links]
+        # A single array parameter keeps the statement text identical for any
+        # selection size (no per-size placeholder lists, no parameter limit)
+        # Only the columns the CSV/ZIP exports read
+        cursor.execute("""
+            SELECT short_code, original_url, display_name, clicks,
+                   password_hash, expiration_date, created_at
+            FROM links 
+            WHERE id = ANY(%s) AND user_id = %s
+        """, (link_ids, user_id))
+        # RealDictCursor rows are already dicts - no per-row copy needed
+        return cursor.fetchall()
 
     except Exception as e:
         print(f"Error getting selected links: {e}")
@@ -379,18 +468,16 @@ def api_get_links():
         links = get_user_links(user_id)
         
         # Format links for API response
-        api_links = []
-        for link in links:
-            api_links.append({
-                'id': link['id'],
-                'short_code': link['short_code'],
-                'original_url': link['original_url'],
-                'display_name': link['display_name'],
-                'clicks': link['clicks'],
-                'is_active': link['is_active'],
-                'created_at': link['created_at'],
-                'qr_url': url_for('links.qr_image', link_id=link['id'], _external=True)
-            })
+        api_links = [{
+            'id': link['id'],
+            'short_code': link['short_code'],
+            'original_url': link['original_url'],
+            'display_name': link['display_name'],
+            'clicks': link['clicks'],
+            'is_active': link['is_active'],
+            'created_at': link['created_at'],
+            'qr_url': url_for('links.qr_image', link_id=link['id'], _external=True)
+        } for link in links]
         
         return jsonify({
             'success': True,
@@ -436,7 +523,7 @@ def api_get_link(link_id):
                 'is_active': link['is_active'],
                 'created_at': link['created_at'],
                 'qr_url': url_for('links.qr_image', link_id=link['id'], _external=True),
-                'short_url': f"{request.url_root.rstrip('/')}/{link['short_code']}"
+                'short_url': f"{short_url_root()}/{link['short_code']}"
             }
         })
         
@@ -474,50 +561,75 @@ def bulk_delete():
 
     return redirect(url_for('links.dashboard'))
 
-@links_bp.route('/export/csv')
-def export_csv():
-    """Export user links as CSV file."""
-    if 'user_id' not in session:
-        flash('Please log in first.', 'error')
-        return redirect(url_for('auth.login'))
-
-    user_id = session['user_id']
-    username = session['username']
-
-    # Get all user links
-    links = get_user_links(user_id)
-
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow([
-        'Short URL', 'Original URL', 'Display Name', 'Clicks', 
-        'Password Protected', 'Expiration Date', 'Created Date'
-    ])
+CSV_HEADER = (
+    'Short URL', 'Original URL', 'Display Name', 'Clicks', 
+    'Password Protected', 'Expiration Date', 'Created Date'
+)
 
-    # Data rows
-    for link in links:
-        short_url = f"{request.url_root.rstrip('/')}/{link['short_code']}"
-        writer.writerow([
-            short_url,
+def link_csv_rows(links):
+    """Lazily build one CSV row tuple per link (consumed in slices by csv_response)."""
+    root = short_url_root()
+    return (
+        (
+            f"{root}/{link['short_code']}",
             link['original_url'],
             link['display_name'],
             link['clicks'],
             'Yes' if link['password_hash'] else 'No',
             link['expiration_date'] or 'Never',
             link['created_at']
-        ])
-
-    output.seek(0)
+        )
+        for link in links
+    )
 
+def csv_response(links, filename, chunk_rows=500):
+    """
+    Stream links as a CSV download.
+    
+    Rows are written chunk_rows at a time with csv.writer.writerows and each
+    chunk is flushed to the client, so the full export is never held in
+    memory as one string.
+    """
+    rows = link_csv_rows(links)
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_HEADER)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_rows))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Header only (no links) - or nothing left after the last chunk
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    # Keep the request context (and its DB connection) alive while streaming
     return Response(
-        output.getvalue(),
+        stream_with_context(generate()),
         mimetype='text/csv',
-        headers={'Content-Disposition': f'attachment; filename=linkforge_links_{username}.csv'}
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
     )
 
+@links_bp.route('/export/csv')
+def export_csv():
+    """Export user links as CSV file."""
+    if 'user_id' not in session:
+        flash('Please log in first.', 'error')
+        return redirect(url_for('auth.login'))
+
+    user_id = session['user_id']
+    username = session['username']
+
+    # Stream rows straight from a server-side cursor
+    links = iter_user_links(user_id)
+
+    return csv_response(links, f'linkforge_links_{username}.csv')
+
 @links_bp.route('/export/bulk_csv', methods=['POST'])
 def bulk_export_csv():
     """Export selected links as CSV using DRY helper function."""
@@ -540,34 +652,7 @@ def bulk_export_csv():
         flash('No valid links found.', 'error')
         return redirect(url_for('links.dashboard'))
 
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow([
-        'Short URL', 'Original URL', 'Display Name', 'Clicks', 
-        'Password Protected', 'Expiration Date', 'Created Date'
-    ])
-
-    for link in links:
-        short_url = f"{request.url_root.rstrip('/')}/{link['short_code']}"
-        writer.writerow([
-            short_url,
-            link['original_url'],
-            link['display_name'],
-            link['clicks'],
-            'Yes' if link['password_hash'] else 'No',
-            link['expiration_date'] or 'Never',
-            link['created_at']
-        ])
-
-    output.seek(0)
-
-    return Response(
-        output.getvalue(),
-        mimetype='text/csv',
-        headers={'Content-Disposition': f'attachment; filename=linkforge_selected_{username}.csv'}
-    )
+    return csv_response(links, f'linkforge_selected_{username}.csv')
 
 @links_bp.route('/download_qr/<int:link_id>')
 def download_qr(link_id):
@@ -592,10 +677,10 @@ def download_qr(link_id):
             return redirect(url_for('links.dashboard'))
 
         # Generate high-quality QR code using consolidated function
-        short_url = f"{request.url_root.rstrip('/')}/{link['short_code']}"
+        short_url = f"{short_url_root()}/{link['short_code']}"
         
         # Clean filename
-        safe_name = re.sub(r'[<>:"/\|?*]', '_', link['display_name'])
+        safe_name = UNSAFE_FILENAME_RE.sub('_', link['display_name'])
         filename = f"{safe_name}_qr_code.png"
 
         return generate_qr_code(short_url, size='large', as_attachment=True, filename=filename)
@@ -626,9 +711,10 @@ def qr_image(link_id):
             return "Link not found", 404
 
         # Generate QR code using consolidated function
-        short_url = f"{request.url_root.rstrip('/')}/{link['short_code']}"
+        short_url = f"{short_url_root()}/{link['short_code']}"
         
-        return generate_qr_code(short_url, size='small', as_attachment=False)
+        return generate_qr_code(short_url, size='small', as_attachment=False,
+                                max_age=QR_IMAGE_MAX_AGE)
 
     except Exception as e:
         print(f"Error in qr_image: {e}")
@@ -660,28 +746,17 @@ def bulk_qr_download():
         # Create ZIP file
         zip_buffer = io.BytesIO()
 
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # PNGs are already deflate-compressed, so store them as-is
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
             for link in links:
-                short_url = f"{request.url_root.rstrip('/')}/{link['short_code']}"
-
-                # Generate QR code
-                qr = qrcode.QRCode(version=1, box_size=10, border=4)
-                qr.add_data(short_url)
-                qr.make(fit=True)
-
-                # Create traditional black QR pattern on white background
-                img = qr.make_image(fill_color="#000000", back_color="#ffffff")
-
-                # Save to buffer
-                img_buffer = io.BytesIO()
-                img.save(img_buffer, format='PNG')
+                short_url = f"{short_url_root()}/{link['short_code']}"
 
                 # Clean filename
-                safe_name = re.sub(r'[<>:"/\|?*]', '_', link['display_name'])
+                safe_name = UNSAFE_FILENAME_RE.sub('_', link['display_name'])
                 filename = f"{safe_name}_qr_code.png"
 
-                # Add to ZIP
-                zip_file.writestr(filename, img_buffer.getvalue())
+                # Add to ZIP - same cached renderer as the single download
+                zip_file.writestr(filename, render_qr_png(short_url, 'large'))
 
         zip_buffer.seek(0)
 
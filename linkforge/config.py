@@ -22,6 +22,7 @@ and environment variables following common practices.
 
 import os
 from datetime import timedelta
+from functools import lru_cache
 
 class Config:
     """
@@ -88,6 +89,10 @@ class Config:
     # HttpOnly cookies prevent JavaScript access (XSS protection)
     # This is a security best practice to prevent session hijacking
     SESSION_COOKIE_HTTPONLY = True
+    
+    # SameSite=Lax keeps the cookie off cross-site POSTs (CSRF mitigation)
+    # while still sending it on normal top-level navigation to the dashboard
+    SESSION_COOKIE_SAMESITE = 'Lax'
 
     # 🔒 PASSWORD SECURITY REQUIREMENTS
     # =================================
@@ -96,6 +101,14 @@ class Config:
     MIN_PASSWORD_LENGTH = 6    # Minimum for basic security
     MAX_PASSWORD_LENGTH = 15   # Reasonable upper limit for usability
 
+    # Account password hashing algorithm (werkzeug method string)
+    # Stored hashes carry their method, so changing this upgrades users on next login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+
+    # Link password hashing - checked on every protected redirect, so it uses
+    # a cheaper cost than account passwords (existing hashes keep their method)
+    LINK_PASSWORD_HASH_METHOD = os.environ.get('LINK_PASSWORD_HASH_METHOD', 'pbkdf2:sha256:10000')
+
     # 📊 APPLICATION BUSINESS LOGIC SETTINGS
     # ======================================
     # Maximum links per user - prevents abuse and manages database size
@@ -145,6 +158,13 @@ class ProductionConfig(Config):
     # This prevents session hijacking over insecure connections
     SESSION_COOKIE_SECURE = True
 
+# Environment name (FLASK_ENV) -> configuration class
+CONFIGS = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+}
+
+@lru_cache(maxsize=1)
 def get_config():
     """
     🎯 CONFIGURATION FACTORY FUNCTION
@@ -166,6 +186,9 @@ def get_config():
     for the current environment, making deployment easier and reducing
     the chance of configuration errors."
     
+    The environment is fixed once the process starts, so the instance is
+    built on the first call and reused afterwards.
+    
     Returns:
         Config: Appropriate configuration instance for current environment
     """
@@ -173,16 +196,14 @@ def get_config():
     env = os.environ.get('FLASK_ENV', 'development')
 
     # Return appropriate configuration class
-    if env == 'production':
-        return ProductionConfig()
-    else:
-        # Default to development config for safety
-        # Better to be overly permissive in dev than overly restrictive
-        return DevelopmentConfig()
+    # Unknown environments default to development config for safety
+    # Better to be overly permissive in dev than overly restrictive
+    return CONFIGS.get(env, DevelopmentConfig)()
 
 # 🎯 **EXTENSIBILITY NOTES:**
 # ==========================
-# This configuration system can easily be extended for additional environments:
+# This configuration system can easily be extended for additional environments
+# (define the class, then add it to CONFIGS):
 # 
 # class TestingConfig(Config):
 #     """Configuration for automated testing."""
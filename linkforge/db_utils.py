@@ -22,9 +22,61 @@ an approach used in applications for efficient resource management.
 
 import psycopg2
 import psycopg2.extras
-from flask import g
-import os
+import psycopg2.pool
+from flask import g, request, has_request_context
+import atexit
 import os
+import threading
+
+# 🏊 PROCESS-WIDE CONNECTION POOL
+# ===============================
+# Created lazily on first use so each (forked) worker process builds its own pool
+# after DATABASE_URL has been loaded from the environment.
+_pool = None
+_pool_lock = threading.Lock()
+
+# Requests with these methods only read, so their connection runs in autocommit
+# mode: no implicit BEGIN before the first query and no ROLLBACK at teardown
+READ_ONLY_METHODS = frozenset({'GET', 'HEAD'})
+
+def get_pool():
+    """
+    🏊 CONNECTION POOL FACTORY
+    ==========================
+    
+    Return the process-wide connection pool, creating it on first call.
+    
+    📚 **WHY POOL CONNECTIONS?**
+    Opening a PostgreSQL connection costs a TCP handshake, TLS negotiation and
+    authentication round-trip. Keeping a small set of long-lived connections
+    and leasing one per request removes that cost from every request.
+    
+    Pool size is controlled by DB_POOL_MIN / DB_POOL_MAX environment variables.
+    
+    Returns:
+        psycopg2.pool.ThreadedConnectionPool: Shared pool for this process
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    int(os.environ.get('DB_POOL_MIN', 1)),
+                    int(os.environ.get('DB_POOL_MAX', 10)),
+                    os.environ.get('DATABASE_URL'),
+                    cursor_factory=psycopg2.extras.RealDictCursor  # Enables dict-like result access
+                )
+    return _pool
+
+def close_pool():
+    """Close every pooled connection (registered to run at interpreter exit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+atexit.register(close_pool)
 
 def get_db_connection():
     """
@@ -45,9 +97,9 @@ def get_db_connection():
     5. **Common Pattern**: Used in Flask applications
     
     🔄 **CONNECTION LIFECYCLE:**
-    1. First call in request → Create connection, store in g.db_conn
+    1. First call in request → Lease connection from the pool, store in g.db_conn
     2. Subsequent calls → Return existing connection from g.db_conn  
-    3. End of request → Flask calls teardown handler to close connection
+    3. End of request → Flask calls teardown handler to return it to the pool
     
     📖 **INTERVIEW EXPLANATION:**
     "I use Flask's g object to store database connections per request. This ensures
@@ -59,16 +111,18 @@ def get_db_connection():
     """
     # Check if connection already exists in this request's context
     if 'db_conn' not in g:
-        # Create new connection and store in Flask's g object
+        # Lease a pooled connection and store in Flask's g object
         # 
         # 🔧 **POSTGRESQL CONNECTION DETAILS:**
-        # - Uses DATABASE_URL environment variable for flexibility
+        # - Pool is built from the DATABASE_URL environment variable
         # - RealDictCursor provides dictionary-like access to results
         # - Connection persists for entire request lifecycle
-        g.db_conn = psycopg2.connect(
-            os.environ.get('DATABASE_URL'),
-            cursor_factory=psycopg2.extras.RealDictCursor  # Enables dict-like result access
-        )
+        # - GET/HEAD requests run in autocommit mode; writes that need to be
+        #   atomic wrap themselves in `with conn:`
+        conn = get_pool().getconn()
+        if has_request_context() and request.method in READ_ONLY_METHODS:
+            conn.autocommit = True
+        g.db_conn = conn
     
     # Return the connection (either newly created or existing)
     return g.db_conn
@@ -107,7 +161,7 @@ def close_db(error=None):
     🧹 REQUEST CLEANUP HANDLER
     ==========================
     
-    Close database connection at the end of each request.
+    Return the database connection to the pool at the end of each request.
     
     📚 **FLASK TEARDOWN PATTERN:**
     This function is registered as a teardown handler with Flask.
@@ -121,8 +175,9 @@ def close_db(error=None):
     
     🔄 **CLEANUP PROCESS:**
     1. Extract connection from g object (if it exists)
-    2. Close the connection if one was created
-    3. Connection is removed from g object automatically
+    2. Roll back any transaction left open and restore transactional mode
+       so the next request starts clean
+    3. Hand the connection back to the pool (broken connections are discarded)
     
     📖 **INTERVIEW EXPLANATION:**
     "This teardown handler ensures database connections are properly closed
@@ -136,9 +191,16 @@ def close_db(error=None):
     # pop() removes the key from g, preventing memory leaks
     db = g.pop('db_conn', None)
     
-    # Close connection if one was created during this request
+    # Return connection to the pool if one was leased during this request
     if db is not None:
-        db.close()
+        discard = bool(db.closed)
+        if not discard:
+            try:
+                db.rollback()
+                db.autocommit = False  # Pooled connections start transactional
+            except psycopg2.Error:
+                discard = True  # Unknown state - don't hand it to the next request
+        get_pool().putconn(db, close=discard)
 
 def init_db_app(app):
     """
@@ -170,17 +232,6 @@ def init_db_app(app):
 # 🎯 **ADVANCED PATTERNS FOR INTERVIEW DISCUSSION:**
 # =================================================
 # 
-# 💡 **CONNECTION POOLING:**
-# In high-traffic production applications, you might use connection pooling:
-# 
-# from psycopg2 import pool
-# 
-# class DatabasePool:
-#     def __init__(self, min_conn=1, max_conn=10):
-#         self.pool = psycopg2.pool.ThreadedConnectionPool(
-#             min_conn, max_conn, DATABASE_URL
-#         )
-# 
 # 💡 **TRANSACTION MANAGEMENT:**
 # For complex operations, you might add transaction support:
 # 
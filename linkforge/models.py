@@ -41,10 +41,56 @@ clicks: id, link_id, ip_address, referrer, user_agent, clicked_at
 
 import psycopg2
 import psycopg2.extras
+from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
-from .db_utils import get_db_cursor, get_db_connection
+from .db_utils import get_db_cursor, get_db_connection, get_pool
+from collections import Counter
+import atexit
+import hashlib
 import os
+import queue
+import secrets
+import threading
+import time
+
+# ⚡ REDIRECT LOOKUP CACHE
+# =======================
+# Short-lived per-process cache of short_code -> link row for the redirect path.
+# Edits and deletes invalidate entries in this process; other worker processes
+# pick up changes once their entry's TTL runs out.
+LINK_CACHE_TTL = 60          # Seconds a cached link stays valid
+LINK_CACHE_SIZE = 10000      # Maximum cached links per process
+_link_cache = {}
+_link_cache_lock = threading.Lock()
+
+# 🔑 LINK PASSWORD VERIFICATION CACHE
+# ===================================
+# Remembers successful link-password checks so refreshes of a protected link
+# skip the deliberately slow KDF. Keys are a keyed BLAKE2b digest (per-process
+# random key) of the stored hash + password, so the plain password is never held.
+PASSWORD_CACHE_TTL = 300     # Seconds a verified password stays trusted
+PASSWORD_CACHE_SIZE = 10000  # Maximum remembered verifications per process
+_password_cache = {}
+_password_cache_lock = threading.Lock()
+_password_cache_key = secrets.token_bytes(32)
+
+# 🔍 SEARCH
+# =========
+# LIKE/ILIKE metacharacters, escaped with PostgreSQL's default escape character (backslash)
+LIKE_ESCAPES = str.maketrans({'\\': '\\\\', '%': '\\%', '_': '\\_'})
+
+# 📊 CLICK RECORDING QUEUE
+# ========================
+# Redirects enqueue clicks; a background thread writes them in batches so the
+# redirect response never waits on an INSERT/UPDATE round-trip.
+CLICK_BATCH_SIZE = 500        # Maximum clicks written per transaction
+CLICK_FLUSH_INTERVAL = 0.5    # Seconds to wait for a batch to fill up
+CLICK_QUEUE_SIZE = 100000     # Pending clicks held before new ones are dropped
+IP_ADDRESS_MAX_LENGTH = 64    # Width of clicks.ip_address (VARCHAR(64))
+_click_queue = queue.Queue(maxsize=CLICK_QUEUE_SIZE)
+_click_writer = None
+_click_writer_lock = threading.Lock()
 
 class DatabaseManager:
     """
@@ -77,7 +123,10 @@ class DatabaseManager:
         🏗️ DATABASE MANAGER INITIALIZATION
         ==================================
         
-        Initialize database manager with connection URL and schema setup.
+        Initialize database manager with connection URL.
+        
+        Creating a manager is free - no connection is opened until
+        init_database() is called explicitly (once, at startup).
         
         Args:
             db_url (str, optional): Database connection URL. Defaults to environment variable.
@@ -85,10 +134,6 @@ class DatabaseManager:
         # Use provided URL or fall back to environment variable
         # This flexibility allows for testing with different databases
         self.db_url = db_url or os.environ.get('DATABASE_URL')
-        
-        # Initialize database schema on instantiation
-        # Ensures database is ready for operations
-        self.init_database()
 
     def get_connection(self):
         """
@@ -182,9 +227,19 @@ class DatabaseManager:
         # 🚀 PERFORMANCE OPTIMIZATION - Database indexes
         # ==============================================
         # Indexes dramatically improve query performance on frequently searched columns
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_links_user_id ON links(user_id)')      # User's links lookup
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_links_short_code ON links(short_code)') # Short code resolution
+        # User's links lookup uses idx_links_user_created below (user_id is its
+        # leading column), so a separate user_id index is pure write overhead
+        cursor.execute('DROP INDEX IF EXISTS idx_links_user_id')
+        # Short code resolution uses the index behind the UNIQUE constraint;
+        # a second index on the same column only doubled write cost
+        cursor.execute('DROP INDEX IF EXISTS idx_links_short_code')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_clicks_link_id ON clicks(link_id)')    # Click analytics
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_links_user_created ON links(user_id, created_at DESC)')  # Dashboard ordering
+        # Expired-link counts - partial, so never-expiring links stay out of it
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_links_user_expiring ON links(user_id, expiration_date)
+            WHERE expiration_date IS NOT NULL
+        """)
         
         # Commit changes and close connection
         conn.commit()
@@ -192,6 +247,33 @@ class DatabaseManager:
 
 
 # User Management Functions
+def _password_hash_method():
+    """Hashing method for account passwords, from app config."""
+    return current_app.config.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+
+
+_dummy_hashes = {}
+
+def _dummy_password_hash():
+    """
+    Hash checked against for unknown users so failed logins take the same time
+    whether or not the account exists (prevents username enumeration).
+    """
+    method = _password_hash_method()
+    if method not in _dummy_hashes:
+        _dummy_hashes[method] = generate_password_hash('linkforge-dummy-password', method=method)
+    return _dummy_hashes[method]
+
+
+def _password_hash_prefix():
+    """
+    Method prefix werkzeug actually stores for the configured method, with
+    defaults expanded (e.g. 'scrypt' is stored as 'scrypt:32768:8:1').
+    Taken from the cached dummy hash, so no extra KDF run is needed.
+    """
+    return _dummy_password_hash().split('$', 1)[0]
+
+
 def create_user(username, email, password):
     """Create new user with validation using DB pattern."""
     try:
@@ -208,23 +290,21 @@ def create_user(username, email, password):
         cursor = get_db_cursor()
         conn = get_db_connection()
 
-        # Check existing users
-        cursor.execute(
-            'SELECT id FROM users WHERE username = %s OR email = %s',
-            (username, email)
-        )
-        existing = cursor.fetchone()
+        # Create user - the UNIQUE constraints on username/email do the
+        # existence check, so a duplicate costs no extra round-trip and two
+        # concurrent sign-ups can't both get past a separate SELECT
+        password_hash = generate_password_hash(password, method=_password_hash_method())
+        cursor.execute("""
+            INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """, (username, email, password_hash))
+        created = cursor.fetchone()
 
-        if existing:
+        if not created:
             return {'success': False, 'message': 'Username or email already exists'}
 
-        # Create user
-        password_hash = generate_password_hash(password)
-        cursor.execute(
-            'INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s) RETURNING id',
-            (username, email, password_hash)
-        )
-        user_id = cursor.fetchone()['id']
+        user_id = created['id']
         conn.commit()
         return {'success': True, 'user_id': user_id}
 
@@ -237,13 +317,25 @@ def authenticate_user(username_or_email, password):
     try:
         cursor = get_db_cursor()
         
-        cursor.execute(
-            'SELECT * FROM users WHERE username = %s OR email = %s',
-            (username_or_email, username_or_email)
-        )
+        # Two unique-index probes; a username match wins over another
+        # account's email, so the result is deterministic
+        cursor.execute("""
+            SELECT id, username, email, password_hash FROM users WHERE username = %s
+            UNION ALL
+            SELECT id, username, email, password_hash FROM users WHERE email = %s
+            LIMIT 1
+        """, (username_or_email, username_or_email))
         user = cursor.fetchone()
 
         if user and check_password_hash(user['password_hash'], password):
+            # Transparently upgrade hashes made with an older method/cost
+            if user['password_hash'].split('$', 1)[0] != _password_hash_prefix():
+                cursor.execute(
+                    'UPDATE users SET password_hash = %s WHERE id = %s',
+                    (generate_password_hash(password, method=_password_hash_method()), user['id'])
+                )
+                get_db_connection().commit()
+
             return {
                 'success': True,
                 'user': {
@@ -253,6 +345,8 @@ def authenticate_user(username_or_email, password):
                 }
             }
         else:
+            if not user:
+                check_password_hash(_dummy_password_hash(), password)
             return {'success': False, 'message': 'Invalid credentials'}
 
     except Exception:
@@ -270,7 +364,7 @@ def get_user_by_id(user_id):
         )
         user = cursor.fetchone()
 
-        return dict(user) if user else None
+        return user
     except Exception:
         return None
 
@@ -296,33 +390,35 @@ def create_link(user_id, original_url, display_name, short_code, password=None,
         conn = get_db_connection()
 
         # Calculate expiration date if specified
+        # (psycopg2 binds datetime objects natively, no ISO string needed)
         expiration_date = None
         if expiration_days and expiration_days > 0:
-            expiration_date = (datetime.now() + timedelta(days=expiration_days)).isoformat()
+            expiration_date = datetime.now() + timedelta(days=expiration_days)
 
         # Hash password if provided
         password_hash = None
         if password and len(password.strip()) > 0:
-            password_hash = generate_password_hash(password.strip())
-
-        # Check for existing short code
-        cursor.execute(
-            'SELECT id FROM links WHERE short_code = %s',
-            (short_code,)
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            return {'success': False, 'message': 'Short code already exists'}
+            password_hash = generate_password_hash(
+                password.strip(),
+                method=current_app.config.get('LINK_PASSWORD_HASH_METHOD', 'pbkdf2:sha256:10000')
+            )
 
-        # Create link
+        # Create link - the UNIQUE constraint on short_code doubles as the
+        # existence check, so a collision costs no extra round-trip
         cursor.execute("""
             INSERT INTO links 
             (user_id, original_url, short_code, display_name, password_hash, expiration_date)
-            VALUES (%s, %s, %s, %s, %s, %s) RETURNING id
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON CONFLICT (short_code) DO NOTHING
+            RETURNING id
         """, (user_id, original_url, short_code, display_name, password_hash, expiration_date))
-        link_id = cursor.fetchone()['id']
+        row = cursor.fetchone()
         conn.commit()
+
+        if row is None:
+            return {'success': False, 'duplicate': True, 'message': 'Short code already exists'}
+
+        link_id = row['id']
         return {
             'success': True,
             'link_id': link_id,
@@ -333,47 +429,99 @@ def create_link(user_id, original_url, display_name, short_code, password=None,
         return {'success': False, 'message': f'Database error: {str(e)}'}
 
 
-def get_user_links(user_id, search_query=None):
-    """Get all links for a user with optional search using professional DB pattern."""
+def get_user_links(user_id, search_query=None, limit=None, offset=0):
+    """
+    Get links for a user with optional search using professional DB pattern.
+
+    limit/offset page through the (user_id, created_at DESC) index; the
+    default limit of None (LIMIT ALL) returns every matching link.
+    """
     try:
         cursor = get_db_cursor()
 
         if search_query:
+            # Escape LIKE wildcards so '%' / '_' in a search match literally
+            pattern = f'%{search_query.translate(LIKE_ESCAPES)}%'
             cursor.execute("""
                 SELECT * FROM links 
                 WHERE user_id = %s 
                 AND (display_name ILIKE %s OR original_url ILIKE %s OR short_code ILIKE %s)
                 ORDER BY created_at DESC
-            """, (user_id, f'%{search_query}%', f'%{search_query}%', f'%{search_query}%'))
+                LIMIT %s OFFSET %s
+            """, (user_id, pattern, pattern, pattern, limit, offset))
         else:
             cursor.execute(
-                'SELECT * FROM links WHERE user_id = %s ORDER BY created_at DESC',
-                (user_id,)
+                'SELECT * FROM links WHERE user_id = %s ORDER BY created_at DESC LIMIT %s OFFSET %s',
+                (user_id, limit, offset)
             )
-        links = cursor.fetchall()
-        return [dict(link) for link in links]
+        # RealDictCursor rows are already dicts - no per-row copy needed
+        return cursor.fetchall()
 
     except Exception:
         return []
 
 
+def iter_user_links(user_id, batch_size=1000):
+    """
+    Yield all links for a user from a server-side cursor.
+
+    Rows arrive from PostgreSQL in batch_size round trips, so a large
+    export never sits in memory as one fetchall() list. Must be consumed
+    while the request's connection is still open (stream_with_context).
+    """
+    # 🌊 Named cursor = server-side cursor in psycopg2; it needs an open
+    # transaction, which `with conn` provides even on autocommit connections
+    conn = get_db_connection()
+    with conn:
+        with conn.cursor(name=f'export_links_{user_id}') as cursor:
+            cursor.itersize = batch_size
+            cursor.execute("""
+                SELECT short_code, original_url, display_name, clicks,
+                       password_hash, expiration_date, created_at
+                FROM links WHERE user_id = %s
+                ORDER BY created_at DESC
+            """, (user_id,))
+            yield from cursor
+
+
 def get_link_by_short_code(short_code):
     """Get link by short code for redirection using professional DB pattern."""
+    cached = _link_cache.get(short_code)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     try:
         cursor = get_db_cursor()
         
-        cursor.execute(
-            'SELECT * FROM links WHERE short_code = %s',
-            (short_code,)
-        )
+        # Only the columns the redirect path reads (this row is also what gets cached)
+        cursor.execute("""
+            SELECT id, original_url, display_name, password_hash,
+                   expiration_date, is_active
+            FROM links WHERE short_code = %s
+        """, (short_code,))
         link = cursor.fetchone()
 
-        return dict(link) if link else None
+        if not link:
+            return None
+
+        with _link_cache_lock:
+            if len(_link_cache) >= LINK_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                _link_cache.pop(next(iter(_link_cache)), None)
+            _link_cache[short_code] = (time.monotonic() + LINK_CACHE_TTL, link)
+        return link
 
     except Exception:
         return None
 
 
+def invalidate_link_cache(short_codes):
+    """Drop cached redirect lookups for the given short codes."""
+    with _link_cache_lock:
+        for short_code in short_codes:
+            _link_cache.pop(short_code, None)
+
+
 def update_link_url(link_id, user_id, new_url):
     """
     Update link destination URL (dynamic link feature) using professional DB pattern.
@@ -382,17 +530,21 @@ def update_link_url(link_id, user_id, new_url):
     where their links redirect without changing the short code.
     """
     try:
-        cursor = get_db_cursor()
         conn = get_db_connection()
+        cursor = conn.cursor()
 
-        # Verify user owns the link
+        # Verify user owns the link - the WHERE clause is the ownership check
+        # and RETURNING reports the result in the same round-trip
         cursor.execute("""
             UPDATE links 
             SET original_url = %s, updated_at = CURRENT_TIMESTAMP
             WHERE id = %s AND user_id = %s
+            RETURNING short_code
         """, (new_url, link_id, user_id))
+        updated = cursor.fetchone()
         conn.commit()
-        if cursor.rowcount > 0:
+        if updated:
+            invalidate_link_cache([updated['short_code']])
             return {'success': True, 'message': 'Link updated successfully'}
         else:
             return {'success': False, 'message': 'Link not found or access denied'}
@@ -404,27 +556,21 @@ def update_link_url(link_id, user_id, new_url):
 def delete_links(link_ids, user_id):
     """Delete multiple links (bulk delete) using professional DB pattern."""
     try:
-        cursor = get_db_cursor()
         conn = get_db_connection()
 
-        # Convert link_ids to placeholders for SQL
-        placeholders = ','.join(['%s'] * len(link_ids))
-        params = link_ids + [user_id]
-        # Delete clicks first (foreign key constraint)
-        cursor.execute(f"""
-            DELETE FROM clicks 
-            WHERE link_id IN (
-                SELECT id FROM links 
-                WHERE id IN ({placeholders}) AND user_id = %s
-            )
-        """, params)
-        # Delete links
-        cursor.execute(f"""
-            DELETE FROM links 
-            WHERE id IN ({placeholders}) AND user_id = %s
-        """, params)
-        deleted_count = cursor.rowcount
-        conn.commit()
+        # Pass all ids as one array parameter - same statement for any batch size
+        params = (list(link_ids), user_id)
+        # clicks.link_id is ON DELETE CASCADE, so deleting the links removes
+        # their click rows in the same statement
+        with conn, conn.cursor() as cursor:
+            cursor.execute("""
+                DELETE FROM links 
+                WHERE id = ANY(%s) AND user_id = %s
+                RETURNING short_code
+            """, params)
+            deleted = cursor.fetchall()
+        deleted_count = len(deleted)
+        invalidate_link_cache(row['short_code'] for row in deleted)
         return {'success': True, 'deleted_count': deleted_count}
 
     except Exception as e:
@@ -432,36 +578,150 @@ def delete_links(link_ids, user_id):
 
 
 def record_click(link_id, ip_address=None, referrer=None, user_agent=None):
-    """Record click analytics using professional DB pattern."""
+    """
+    Queue click analytics for the background writer.
+    
+    Redirects only pay for an in-memory enqueue; the database writes happen
+    in batches on the click writer thread. Returns False if the queue is full
+    (the click is dropped rather than slowing the redirect down).
+    """
+    _ensure_click_writer()
+    # X-Forwarded-For is client-controlled and may be a whole proxy chain:
+    # keep the first (client) entry, cut to the ip_address column width
+    if ip_address:
+        ip_address = ip_address.split(',', 1)[0].strip()[:IP_ADDRESS_MAX_LENGTH]
     try:
-        cursor = get_db_cursor()
-        conn = get_db_connection()
-
-        # Record click
-        cursor.execute("""
-            INSERT INTO clicks (link_id, ip_address, referrer, user_agent)
-            VALUES (%s, %s, %s, %s)
-        """, (link_id, ip_address, referrer or 'Direct', user_agent or ''))
-        # Increment counter
-        cursor.execute(
-            'UPDATE links SET clicks = clicks + 1 WHERE id = %s',
-            (link_id,)
+        _click_queue.put_nowait(
+            (link_id, ip_address, referrer or 'Direct', user_agent or '', datetime.now())
         )
-        conn.commit()
         return True
+    except queue.Full:
+        return False
 
-    except Exception:
+
+def _ensure_click_writer():
+    """Start the click writer thread for this process if it isn't running."""
+    global _click_writer
+    if _click_writer is None or not _click_writer.is_alive():
+        with _click_writer_lock:
+            if _click_writer is None or not _click_writer.is_alive():
+                _click_writer = threading.Thread(
+                    target=_click_writer_loop, name='linkforge-click-writer', daemon=True
+                )
+                _click_writer.start()
+
+
+def _click_writer_loop():
+    """Collect queued clicks into batches and write each batch in one transaction."""
+    while True:
+        batch = [_click_queue.get()]
+        deadline = time.monotonic() + CLICK_FLUSH_INTERVAL
+        while len(batch) < CLICK_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_click_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        write_clicks(batch)
+
+
+def _insert_clicks(conn, batch):
+    """Insert clicks and bump their link counters in one transaction."""
+    with conn:
+        cursor = conn.cursor()
+        # Clicks are analytics: don't wait for the WAL flush on commit.
+        # A server crash can lose the last moments of clicks (rows and
+        # counters together - same transaction), never links or users
+        cursor.execute('SET LOCAL synchronous_commit = off')
+        # execute_values packs the whole batch into multi-row INSERTs
+        # (executemany would send one statement per click). The JOIN drops
+        # clicks for links deleted since they were queued (other workers
+        # may redirect a cached, deleted link for up to LINK_CACHE_TTL)
+        # instead of failing the foreign key and losing the whole batch
+        psycopg2.extras.execute_values(cursor, """
+            INSERT INTO clicks (link_id, ip_address, referrer, user_agent, clicked_at)
+            SELECT v.link_id, v.ip_address, v.referrer, v.user_agent, v.clicked_at
+            FROM (VALUES %s) AS v(link_id, ip_address, referrer, user_agent, clicked_at)
+            JOIN links ON links.id = v.link_id
+        """, batch, page_size=CLICK_BATCH_SIZE)
+        # Sum clicks per link first, so a popular link gets one counter
+        # UPDATE per batch instead of one per click
+        counts = Counter(click[0] for click in batch)
+        psycopg2.extras.execute_values(cursor, """
+            UPDATE links SET clicks = links.clicks + v.n
+            FROM (VALUES %s) AS v(id, n)
+            WHERE links.id = v.id
+        """, list(counts.items()), page_size=CLICK_BATCH_SIZE)
+
+
+# Errors caused by a click's own data (bad value, constraint, NUL byte) -
+# retrying the other clicks without it will succeed
+_CLICK_ROW_ERRORS = (psycopg2.DataError, psycopg2.IntegrityError, ValueError)
+
+def write_clicks(batch):
+    """
+    Insert a batch of queued clicks and bump the link counters.
+    
+    If the batch is rejected because of one row's data, the clicks are
+    retried one per transaction so a single bad click can't drop the rest.
+    """
+    pool = None
+    conn = None
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+        try:
+            _insert_clicks(conn, batch)
+            return True
+        except _CLICK_ROW_ERRORS as e:
+            if len(batch) == 1:
+                raise
+            print(f"Click batch rejected ({e}); retrying clicks individually")
+
+        for click in batch:
+            try:
+                _insert_clicks(conn, [click])
+            except _CLICK_ROW_ERRORS as e:
+                print(f"Dropping click for link {click[0]}: {e}")
+        return True
+
+    except Exception as e:
+        # Pool errors land here too, so the writer thread survives them
+        print(f"Error writing clicks: {e}")
         return False
 
+    finally:
+        if conn is not None:
+            pool.putconn(conn, close=bool(conn.closed))
 
-def is_link_expired(link):
-    """Check if a link has expired."""
+
+def _flush_click_queue():
+    """Write any clicks still queued when the process exits."""
+    batch = []
+    while True:
+        try:
+            batch.append(_click_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        write_clicks(batch)
+
+atexit.register(_flush_click_queue)
+
+
+def is_link_expired(link, now=None):
+    """Check if a link has expired (optionally against a caller-supplied now)."""
     if not link.get('expiration_date'):
         return False
 
+    expiration = link['expiration_date']
     try:
-        expiration = datetime.fromisoformat(link['expiration_date'])
-        return datetime.now() > expiration
+        # TIMESTAMP columns come back from psycopg2 as datetime already
+        if not isinstance(expiration, datetime):
+            expiration = datetime.fromisoformat(expiration)
+        return (now or datetime.now()) > expiration
     except:
         return False
 
@@ -474,7 +734,22 @@ def verify_link_password(link, provided_password):
     if not provided_password:
         return False  # Password required but not provided
 
-    return check_password_hash(link['password_hash'], provided_password)
+    digest = hashlib.blake2b(
+        f"{link['password_hash']}\0{provided_password}".encode(),
+        key=_password_cache_key, digest_size=16
+    ).digest()
+    expires = _password_cache.get(digest)
+    if expires is not None and expires > time.monotonic():
+        return True
+
+    if not check_password_hash(link['password_hash'], provided_password):
+        return False
+
+    with _password_cache_lock:
+        if len(_password_cache) >= PASSWORD_CACHE_SIZE:
+            _password_cache.pop(next(iter(_password_cache)), None)
+        _password_cache[digest] = time.monotonic() + PASSWORD_CACHE_TTL
+    return True
 
 
 def get_user_stats(user_id):
@@ -482,30 +757,24 @@ def get_user_stats(user_id):
     try:
         cursor = get_db_cursor()
 
-        # Get basic stats
+        # All four counters in one pass over the user's links
+        # (expiry is checked against the app clock, like is_link_expired)
         cursor.execute("""
             SELECT 
                 COUNT(*) as total_links,
                 COALESCE(SUM(clicks), 0) as total_clicks,
-                COUNT(CASE WHEN is_active = TRUE THEN 1 END) as active_links
+                COUNT(*) FILTER (WHERE is_active) as active_links,
+                COUNT(*) FILTER (WHERE expiration_date < %s) as expired_count
             FROM links 
             WHERE user_id = %s
-        """, (user_id,))
+        """, (datetime.now(), user_id))
         stats = cursor.fetchone()
-        # Count expired links
-        now = datetime.now()
-        cursor.execute("""
-            SELECT COUNT(*) as expired_count
-            FROM links 
-            WHERE user_id = %s AND expiration_date IS NOT NULL AND expiration_date < %s
-        """, (user_id, now))
-        expired = cursor.fetchone()
 
         return {
             'total_links': stats['total_links'] or 0,
             'total_clicks': stats['total_clicks'] or 0,
             'active_links': stats['active_links'] or 0,
-            'expired_links': expired['expired_count'] or 0
+            'expired_links': stats['expired_count'] or 0
         }
 
     except Exception: